@@ -52,6 +52,14 @@ from movieparse.main import Movieparse
     type=str,
     help="ISO-639-1 shortcode for getting locale information.",
 )
+@click.option(
+    "-f",
+    "--output_format",
+    type=click.Choice(Movieparse.output_formats),
+    default="csv",
+    show_default=True,
+    help="File format for writing metadata.",
+)
 @click.pass_context
 def cli(
     ctx: Context,
@@ -60,6 +68,7 @@ def cli(
     lax: bool,
     parsing_style: int,
     language: str,
+    output_format: str,
 ) -> None:
     """Take general arguments and pass them as context object."""
     ctx.ensure_object(dict)
@@ -68,6 +77,7 @@ def cli(
     ctx.obj["lax"] = lax
     ctx.obj["parsing_style"] = parsing_style
     ctx.obj["language"] = language
+    ctx.obj["output_format"] = output_format
 
 
 @cli.command("dir", help="Use ROOT_MOVIE_DIRs subfolder names to lookup metadata.")
@@ -90,6 +100,7 @@ def from_dir(ctx: Context, root_movie_dir: Path) -> None:
     lax = ctx.obj["lax"]
     parsing_style = ctx.obj["parsing_style"]
     language = ctx.obj["language"]
+    output_format = ctx.obj["output_format"]
     root_movie_dir = Path(root_movie_dir)
 
     m = Movieparse(
@@ -98,6 +109,7 @@ def from_dir(ctx: Context, root_movie_dir: Path) -> None:
         strict=lax,
         parsing_style=parsing_style,
         language=language,
+        output_format=output_format,
     )
     m.parse_root_movie_dir(root_movie_dir)
     m.write()
@@ -118,6 +130,7 @@ def from_list(ctx: Context, movielist: Tuple[str]) -> None:
     lax = ctx.obj["lax"]
     parsing_style = ctx.obj["parsing_style"]
     language = ctx.obj["language"]
+    output_format = ctx.obj["output_format"]
 
     m = Movieparse(
         tmdb_api_key=tmdb_api_key,
@@ -125,6 +138,7 @@ def from_list(ctx: Context, movielist: Tuple[str]) -> None:
         strict=lax,
         parsing_style=parsing_style,
         language=language,
+        output_format=output_format,
     )
     m.parse_movielist(list(movielist))
     m.write()
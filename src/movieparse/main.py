@@ -4,13 +4,23 @@ import asyncio
 import os
 import re
 from pathlib import Path
+from typing import Any
+from typing import ClassVar
 from typing import Dict
 from typing import List
+from typing import Tuple
 
 import aiohttp
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
+from tqdm.asyncio import tqdm_asyncio
+
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads  # type: ignore [assignment, unused-ignore]
 
 
 class Movieparse:
@@ -22,6 +32,7 @@ class Movieparse:
       parsing_style: Define parsing style to use. -1 for estimating parsing style.
       strict: Always use title and release year for looking up metadata, no fallback to title only.
       language: ISO-639-1 shortcode for getting locale information.
+      output_format: File format for writing metadata, one of csv, parquet or feather.
     """
 
     mapping = pd.DataFrame()
@@ -30,6 +41,24 @@ class Movieparse:
     ) = crew = details = genres = prod_comp = prod_count = spoken_langs = pd.DataFrame()
     cached_mapping = pd.DataFrame()
 
+    _PATTERNS: ClassVar[Dict[int, re.Pattern[str]]] = {
+        0: re.compile(r"^(?P<year>\d{4})\s{1}(?P<title>.+)$"),
+        1: re.compile(r"^(?P<year>\d{4})\s-\s(?P<title>.+)$"),
+        2: re.compile(r"^(?P<title>.+)\s(?P<year>\d{4})$"),
+    }
+    # all patterns as optional lookaheads, so a single scan captures year_<style> and title_<style> for each style
+    _COMBINED_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        "^"
+        + "".join(
+            "(?:(?="
+            + p.pattern[1:]
+            .replace("(?P<year>", f"(?P<year_{style}>")
+            .replace("(?P<title>", f"(?P<title_{style}>")
+            + "))?"
+            for style, p in _PATTERNS.items()
+        )
+    )
+
     default_codes = {
         "DEFAULT": 0,
         "NO_RESULT": -1,
@@ -37,6 +66,99 @@ class Movieparse:
         "BAD_RESPONSE": -3,
     }
 
+    output_formats = ["csv", "parquet", "feather"]
+
+    # metadata filenames and the attributes holding their dataframes
+    _METADATA_ATTRS: ClassVar[Dict[str, str]] = {
+        "cast": "cast",
+        "collection": "collect",
+        "crew": "crew",
+        "genres": "genres",
+        "production_companies": "prod_comp",
+        "production_countries": "prod_count",
+        "spoken_languages": "spoken_langs",
+        "details": "details",
+    }
+
+    # tmdb_id is shared among all metadata files but only listed for mapping.csv.
+    _TYPES: Dict[str, Any] = {
+        # mapping.csv
+        "tmdb_id": "int32",
+        "tmdb_id_man": "int32",
+        "input": object,  # can be both a string and a path!
+        "canonical_input": str,
+        # cast.csv
+        "cast.adult": bool,
+        "cast.gender": "int8",
+        "cast.id": int,
+        "cast.known_for_department": "category",
+        "cast.name": str,
+        "cast.original_name": str,
+        "cast.popularity": float,
+        "cast.profile_path": str,
+        "cast.cast_id": "int8",
+        "cast.character": str,
+        "cast.credit_id": str,
+        "cast.order": "int8",
+        # collections.csv
+        "collection.id": int,
+        "collection.name": str,
+        "collection.poster_path": str,
+        "collection.backdrop_path": str,
+        # crew.csv
+        "crew.adult": bool,
+        "crew.gender": "int8",
+        "crew.id": int,
+        "crew.known_for_department": "category",
+        "crew.name": str,
+        "crew.original_name": str,
+        "crew.popularity": float,
+        "crew.profile_path": str,
+        "crew.credit_id": str,
+        "crew.department": "category",
+        "crew.job": str,
+        # genres.csv
+        "genres.id": "int8",
+        "genres.name": str,
+        # production_companies.csv
+        "production_companies.id": "int32",
+        "production_companies.logo_path": str,
+        "production_companies.name": "category",
+        "production_companies.origin_country": "category",
+        "production_countries.iso_3166_1": "category",
+        "production_countries.name": str,
+        # spoken_languages.csv
+        "spoken_languages.english_name": "category",
+        "spoken_languages.iso_3166_1": "category",
+        "spoken_languages.name": str,
+        # details.csv
+        "adult": bool,
+        "backdrop_path": str,
+        "budget": int,
+        "homepage": str,
+        "imdb_id": str,
+        "original_language": "category",
+        "original_title": str,
+        "overview": str,
+        "popularity": float,
+        "poster_path": str,
+        "release_date": "datetime64[ns]",
+        "revenue": int,
+        "runtime": "int16",
+        "status": "category",
+        "tagline": str,
+        "title": str,
+        "video": bool,
+        "vote_average": float,
+        "vote_count": "int16",
+    }
+
+    _TMDB_API_URL = "https://api.themoviedb.org/3"
+    _MAX_CONNECTIONS = 32
+    _MAX_RETRIES = 3
+    _REQUEST_TIMEOUT = 30
+    _WRITE_BUFFER_SIZE = 1 << 20
+
     def __init__(
         self,
         output_dir: Path | None = None,
@@ -44,45 +166,53 @@ class Movieparse:
         parsing_style: int = -1,
         strict: bool = False,
         language: str = "en_US",
+        output_format: str = "csv",
     ):
         """Initilizes movieparser."""
         self._STRICT = strict
         self._LANGUAGE = language
 
+        if output_format not in self.output_formats:
+            raise Exception("please supply a valid OUTPUT_FORMAT!")
+        if output_format != "csv":
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                raise Exception(
+                    f"please install movieparse[parquet] to use the OUTPUT_FORMAT {output_format}!"
+                )
+        self._OUTPUT_FORMAT = output_format
+
         if output_dir is None:
             output_dir = Path.cwd()
         elif output_dir.is_dir() is False:
             raise Exception("please supply an OUTPUT_DIR that is a directory!")
         self._OUTPUT_DIR = output_dir
 
-        if tmdb_api_key is None and os.getenv("TMDB_API_KEY") is not None:
-            self._TMDB_API_KEY = os.getenv("TMDB_API_KEY")
-        elif tmdb_api_key is not None:
-            self._TMDB_API_KEY = tmdb_api_key
-        else:
+        if tmdb_api_key is None:
+            tmdb_api_key = os.getenv("TMDB_API_KEY")
+        if tmdb_api_key is None:
             raise Exception("please supply a TMDB_API_KEY!")
+        self._TMDB_API_KEY = tmdb_api_key
 
-        if parsing_style not in range(
-            -1, max(Movieparse.get_parsing_patterns().keys())
-        ):
+        if parsing_style not in range(-1, max(Movieparse._PATTERNS.keys())):
             raise Exception("please supply a valid PARSING_STYLE!")
         else:
             self._PARSING_STYLE = parsing_style
 
+        self._id_cache: Dict[Tuple[str, str], int] = {}
         self._read_existing()
 
-    @staticmethod
-    def get_parsing_patterns() -> dict[int, re.Pattern[str]]:
+    @classmethod
+    def get_parsing_patterns(cls) -> dict[int, re.Pattern[str]]:
         """Lists all valid patterns for extracting title and (optionally release year) from input.
 
+        The patterns are compiled once with the class, this returns a copy of them.
+
         Returns:
           A dict mapping integer keys to their regex pattern.
         """
-        return {
-            0: re.compile(r"^(?P<year>\d{4})\s{1}(?P<title>.+)$"),
-            1: re.compile(r"^(?P<year>\d{4})\s-\s(?P<title>.+)$"),
-            2: re.compile(r"^(?P<title>.+)\s(?P<year>\d{4})$"),
-        }
+        return dict(cls._PATTERNS)
 
     def parse_movielist(self, movielist: List[str]) -> None:
         """Parse movie metadata from movielist.
@@ -111,7 +241,8 @@ class Movieparse:
         if root_movie_dir.is_dir() is False:
             raise Exception("root_movie_dir has to be a directory!")
 
-        names = [f for f in root_movie_dir.iterdir() if f.is_dir()]
+        with os.scandir(root_movie_dir) as entries:
+            names = [Path(e.path) for e in entries if e.is_dir()]
 
         self.mapping = pd.DataFrame(
             {
@@ -130,37 +261,69 @@ class Movieparse:
             self._guess_parsing_style()
 
         self._update_mapping()
-        self._get_ids()
-        self._update_metadata_lookup_ids()
-        asyncio.run(self._get_metadata())
+        asyncio.run(self._lookup())
+
+    async def _lookup(self) -> None:
+        """Looks up tmdb_ids and their metadata, reusing one client session for all requests."""
+        semaphore = asyncio.Semaphore(self._MAX_CONNECTIONS)
+        async with self._client_session() as session:
+            await self._get_ids(session, semaphore)
+            self._update_metadata_lookup_ids()
+            await self._get_metadata(session, semaphore)
 
     def _read_existing(self) -> None:
-        """Read existing metadata and append to internal dataframes."""
-        df_list = []
-        for fname, df in self._metadata().items():
-            tmp_path = self._OUTPUT_DIR / f"{fname}.csv"
-            if tmp_path.exists():
-                df = pd.read_csv(tmp_path)
-                df = self._assign_types(df)
-            else:
-                df = pd.DataFrame()
-            df_list.append(df)
-
-        (
-            self.cast,
-            self.collect,
-            self.crew,
-            self.genres,
-            self.prod_comp,
-            self.prod_count,
-            self.spoken_langs,
-            self.details,
-        ) = df_list
-
-        tmp_path = self._OUTPUT_DIR / "mapping.csv"
-        if tmp_path.exists():
-            self.cached_mapping = pd.read_csv(tmp_path)
-            self.cached_mapping = self._assign_types(self.cached_mapping)
+        """Read existing metadata and mapping and append to internal dataframes."""
+        for fname, attr in self._METADATA_ATTRS.items():
+            setattr(self, attr, self._read_file(fname))
+
+        self.cached_mapping = self._read_file("mapping")
+
+    def _read_file(self, fname: str) -> pd.DataFrame:
+        """Reads fname from output_dir.
+
+        Files in _OUTPUT_FORMAT are preferred, CSV files are read as a fallback. Parquet and feather files are written
+        with casted types, so only CSV files need to be casted after reading.
+
+        Args:
+          fname: filename without suffix.
+        Returns:
+          dataframe with casted columns, empty if no file exists.
+        """
+        parquet_path = self._OUTPUT_DIR / f"{fname}.parquet"
+        feather_path = self._OUTPUT_DIR / f"{fname}.feather"
+        tmp_path = self._OUTPUT_DIR / f"{fname}.csv"
+        if self._OUTPUT_FORMAT == "parquet" and parquet_path.exists():
+            return pd.read_parquet(parquet_path)
+        elif self._OUTPUT_FORMAT == "feather" and feather_path.exists():
+            return pd.read_feather(feather_path)
+        elif tmp_path.exists():
+            return self._read_csv(tmp_path)
+        return pd.DataFrame()
+
+    def _read_csv(self, path: Path) -> pd.DataFrame:
+        """Reads a CSV file, casting columns to the types specified in _TYPES while parsing.
+
+        Integer and boolean columns are parsed as their nullable counterpart first and then casted via _assign_types,
+        so they only stay nullable if they contain missing values.
+
+        Args:
+          path: CSV file to read.
+        Returns:
+          dataframe with casted columns.
+        """
+        dates = [k for k, v in self._TYPES.items() if v == "datetime64[ns]"]
+        df = pd.read_csv(
+            path,
+            dtype={
+                k: self._nullable_type(v)
+                for k, v in self._TYPES.items()
+                if k not in dates
+            },
+        )
+        for k in dates:
+            if k in df.columns:
+                df[k] = pd.to_datetime(df[k])
+        return self._assign_types(df)
 
     def _metadata(self) -> dict[str, pd.DataFrame]:
         """Provides a dictionary for compactly allocating metadata.
@@ -169,14 +332,7 @@ class Movieparse:
           Dictionary with filenames as keys and internal dataframes as values.
         """
         return {
-            "cast": self.cast,
-            "collection": self.collect,
-            "crew": self.crew,
-            "genres": self.genres,
-            "production_companies": self.prod_comp,
-            "production_countries": self.prod_count,
-            "spoken_languages": self.spoken_langs,
-            "details": self.details,
+            fname: getattr(self, attr) for fname, attr in self._METADATA_ATTRS.items()
         }
 
     def _guess_parsing_style(self) -> None:
@@ -186,16 +342,11 @@ class Movieparse:
           Expection if two or more styles have the same amount of matches or if no styles match.
         """
         tmp = self.mapping[["canonical_input"]].copy()
+        ext = tmp["canonical_input"].str.extract(self._COMBINED_PATTERN, expand=True)
         max_matches = 0
         conflict = False
-        for style, pattern in Movieparse.get_parsing_patterns().items():
-            matches = (
-                tmp["canonical_input"]
-                .str.extract(pattern, expand=True)
-                .notnull()
-                .sum()
-                .sum()
-            )
+        for style in self._PATTERNS:
+            matches = ext[[f"year_{style}", f"title_{style}"]].notnull().sum().sum()
             if matches > max_matches:
                 self._PARSING_STYLE = style
                 max_matches = matches
@@ -217,80 +368,77 @@ class Movieparse:
         For dupes only the column canonical_input is considered. If the user previously entered values in tmdb_id_man,
         these will be kept.
         """
+        if self.cached_mapping.empty:
+            cached = set()
+        else:
+            cached = set(self.cached_mapping["canonical_input"])
+        fresh = self.mapping[~self.mapping["canonical_input"].isin(cached)]
         self.mapping = pd.concat(
-            [self.cached_mapping, self.mapping], axis=0, ignore_index=True
-        ).drop_duplicates(subset="canonical_input", keep="first")
+            [self.cached_mapping, fresh.drop_duplicates(subset="canonical_input")],
+            axis=0,
+            ignore_index=True,
+            copy=False,
+        )
 
-    def _get_ids(self) -> None:
-        asyncio.run(self._get_ids_async(exact=True))
+    async def _get_ids(
+        self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore
+    ) -> None:
+        """Extracts title and year once from canonical_input and looks up their tmdb_ids.
 
-        if not self._STRICT:
-            asyncio.run(self._get_ids_async(exact=False))
+        Uses _PARSING_STYLE to extract title and year from canonical input. Rows that need a lookup but don't match
+        get the NO_EXTRACT code and are dropped from canon_ext. The remaining index is used later for stitching the
+        results together.
+
+        Args:
+          session: client session used for the requests.
+          semaphore: semaphore bounding the amount of requests in flight.
+        """
+        pattern = self._PATTERNS[self._PARSING_STYLE]
+        canon_ext = self.mapping["canonical_input"].str.extract(pattern, expand=True)
+        needed = self.mapping["tmdb_id"].isin(self.default_codes.values())
+        extracted = canon_ext.notna().all(axis=1)
+        self.mapping.loc[needed & ~extracted, "tmdb_id"] = self.default_codes[
+            "NO_EXTRACT"
+        ]
+        canon_ext = canon_ext[needed & extracted]
+
+        await self._get_ids_async(session, semaphore, canon_ext)
 
         self.mapping = self._assign_types(self.mapping)
-        self.mapping.to_csv(
-            (self._OUTPUT_DIR / "mapping.csv"), date_format="%Y-%m-%d", index=False
-        )
+        self._write_file(self.mapping.astype({"input": str}), "mapping")
 
-    async def _get_ids_async(self, exact: bool) -> None:
-        """Asynchronously lookup tmdb_ids from canonical_input.
+    async def _get_ids_async(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        canon_ext: pd.DataFrame,
+    ) -> None:
+        """Asynchronously lookup tmdb_ids from extracted titles and years.
 
         Args:
-          exact: whether to create tasks using title and year only.
+          session: client session used for the requests.
+          semaphore: semaphore bounding the amount of requests in flight.
+          canon_ext: dataframe with columns title and year, indexed like mapping.
 
-        Returns:
-          dataframe with a potentially incomplete index and column tmdb_id.
-
-        Uses _PARSING_STYLE to extract title and year from canonical input. If input doesn't match it's dropped from canon_ext.
-        This missing index is used later for stitching the results together.
-        Depending on the exact-argument a list of tasks is created and then run asynchronously.
+        Lookups are memoized by normalized title and year, so duplicate inputs only cause a single request.
         """
-        pattern = Movieparse.get_parsing_patterns()[self._PARSING_STYLE]
-        needed_lookups = self.mapping[
-            self.mapping["tmdb_id"].isin([v for v in self.default_codes.values()])
-        ].copy()
-        canon_ext = (
-            needed_lookups["canonical_input"]
-            .str.extract(pattern, expand=True)
-            .dropna(how="any", axis=0)
+        keys = [
+            (x.strip().lower(), y)
+            for x, y in zip(canon_ext["title"], canon_ext["year"], strict=True)
+        ]
+        lookups = list(dict.fromkeys(k for k in keys if k not in self._id_cache))
+
+        found = await tqdm_asyncio.gather(
+            *[self._search_id(session, semaphore, x, y) for x, y in lookups],
+            desc="{:<35}".format("getting ids from TMDB"),
         )
 
-        session = aiohttp.ClientSession()
-        if exact:
-            tasks = [
-                session.get(
-                    f"https://api.themoviedb.org/3/search/movie/?api_key={self._TMDB_API_KEY}&query={x}&year={y}&include_adult=true",
-                    ssl=False,
-                )
-                for x, y in zip(canon_ext["title"], canon_ext["year"], strict=True)
-            ]
-        else:
-            tasks = [
-                session.get(
-                    f"https://api.themoviedb.org/3/search/movie/?api_key={self._TMDB_API_KEY}&query={x}&include_adult=true",
-                    ssl=False,
-                )
-                for x in canon_ext["title"]
-            ]
-
-        results = []
-        responses = [
-            await f
-            for f in tqdm(
-                asyncio.as_completed(tasks),
-                desc="{:<35}".format(f"getting ids from TMDB, exact: {exact}"),
-                total=len(tasks),
-            )
-        ]
-        for response in responses:
-            try:
-                resp = await response.json()
-                results.append(resp["results"][0]["id"])
-            except IndexError:
-                results.append(self.default_codes["NO_RESULT"])
-            except KeyError:
-                results.append(self.default_codes["BAD_RESPONSE"])
-        await session.close()
+        ids = dict(zip(lookups, found, strict=True))
+        self._id_cache.update(
+            (k, v) for k, v in ids.items() if v != self.default_codes["BAD_RESPONSE"]
+        )
+
+        results = [ids[k] if k in ids else self._id_cache[k] for k in keys]
 
         tmp = pd.DataFrame({"tmdb_id": results}, index=canon_ext.index).reindex(
             self.mapping.index
@@ -300,6 +448,46 @@ class Movieparse:
             pd.notnull(tmp["tmdb_id"]), tmp["tmdb_id"], self.mapping["tmdb_id"]
         )
 
+    async def _search_id(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        title: str,
+        year: str,
+    ) -> int:
+        """Searches the tmdb_id of the most popular match for title and year.
+
+        Unless _STRICT is set, a search without year is made if the first search has no results.
+
+        Args:
+          session: client session used for the requests.
+          semaphore: semaphore bounding the amount of requests in flight.
+          title: movie title.
+          year: release year.
+
+        Returns:
+          tmdb_id or one of the default_codes NO_RESULT and BAD_RESPONSE.
+        """
+        url = f"{self._TMDB_API_URL}/search/movie"
+        params = {
+            "api_key": self._TMDB_API_KEY,
+            "include_adult": "true",
+            "query": title,
+            "year": year,
+        }
+        resp = await self._fetch_json(session, semaphore, url, params)
+        if not self._STRICT and resp is not None and resp.get("results") == []:
+            del params["year"]
+            resp = await self._fetch_json(session, semaphore, url, params)
+
+        try:
+            tmdb_id: int = resp["results"][0]["id"]  # type: ignore [index]
+        except IndexError:
+            return self.default_codes["NO_RESULT"]
+        except (KeyError, TypeError):
+            return self.default_codes["BAD_RESPONSE"]
+        return tmdb_id
+
     def _update_metadata_lookup_ids(self) -> None:
         """Creates a set of ids for looking up metadata and removes movieparse default_codes."""
         self.metadata_lookup_ids = set(self.mapping["tmdb_id"]) | set(
@@ -308,46 +496,106 @@ class Movieparse:
 
         self.metadata_lookup_ids -= {x for x in self.default_codes.values()}
 
-    async def _get_metadata(self) -> None:
-        session = aiohttp.ClientSession()
-        tasks = [
-            session.get(
-                f"https://api.themoviedb.org/3/movie/{tmdb_id}?api_key={self._TMDB_API_KEY}&language={self._LANGUAGE}&append_to_response=credits",
-                ssl=False,
-            )
-            for tmdb_id in self.metadata_lookup_ids
-        ]
+    async def _get_metadata(
+        self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore
+    ) -> None:
+        params = {
+            "api_key": self._TMDB_API_KEY,
+            "language": self._LANGUAGE,
+            "append_to_response": "credits",
+        }
+        responses = await tqdm_asyncio.gather(
+            *[
+                self._fetch_json(
+                    session, semaphore, f"{self._TMDB_API_URL}/movie/{tmdb_id}", params
+                )
+                for tmdb_id in self.metadata_lookup_ids
+            ],
+            desc="{:<35}".format("getting metadata from TMDB"),
+        )
 
-        responses = [
-            await f
-            for f in tqdm(
-                asyncio.as_completed(tasks),
-                desc="{:<35}".format("getting metadata from TMDB"),
-                total=len(tasks),
-            )
-        ]
+        buffers = {fname: [df] for fname, df in self._metadata().items()}
         for response in tqdm(responses, desc="{:<35}".format("organizing responses")):
-            if response.status == 200:
-                self._dissect_metadata_response(await response.json())
-        await session.close()
+            if response is not None:
+                self._dissect_metadata_response(response, buffers)
+
+        for fname, attr in self._METADATA_ATTRS.items():
+            setattr(self, attr, pd.concat(buffers[fname], axis=0, ignore_index=True))
+
+    def _client_session(self) -> aiohttp.ClientSession:
+        """Creates a client session keeping connections to TMDB alive between requests.
 
-    def _dissect_metadata_response(self, response: Dict[str, object]) -> None:
-        results = []
+        Returns:
+          aiohttp session limited to _MAX_CONNECTIONS concurrent connections and _REQUEST_TIMEOUT seconds per request.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self._MAX_CONNECTIONS, ttl_dns_cache=300, ssl=False
+        )
+        timeout = aiohttp.ClientTimeout(total=self._REQUEST_TIMEOUT)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    async def _fetch_json(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        url: str,
+        params: Dict[str, str],
+    ) -> Dict[str, Any] | None:
+        """Requests url and decodes the JSON response.
+
+        Rate limited requests (HTTP 429), connection errors and timeouts are retried up to _MAX_RETRIES times with
+        exponential backoff.
+
+        Args:
+          session: client session used for the request.
+          semaphore: semaphore bounding the amount of requests in flight.
+          url: url to request.
+          params: query parameters, including the api_key.
+
+        Returns:
+          decoded response or None if the request didn't succeed.
+        """
+        async with semaphore:
+            for attempt in range(self._MAX_RETRIES + 1):
+                try:
+                    async with session.get(url, params=params) as response:
+                        if response.status == 200:
+                            result: Dict[str, Any] = json_loads(await response.read())
+                            return result
+                        if response.status != 429:
+                            return None
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    pass
+                if attempt < self._MAX_RETRIES:
+                    await asyncio.sleep(2**attempt)
+        return None
+
+    def _dissect_metadata_response(
+        self, response: Dict[str, object], buffers: Dict[str, List[pd.DataFrame]]
+    ) -> None:
+        """Splits a metadata response into one dataframe per metadata file.
+
+        The dataframes are only appended to buffers, concatenating them is left to the caller.
+
+        Args:
+          response: decoded metadata response for a single tmdb_id.
+          buffers: dictionary with filenames as keys and lists of dataframes as values.
+        """
         tmdb_id = response.pop("id")
-        for c, df in self._metadata().items():
+        for c, dfs in buffers.items():
 
             tmp = pd.DataFrame()
 
             if c in ["cast", "crew"]:
-                tmp = pd.json_normalize(response["credits"].pop(c)).add_prefix(f"{c}.")  # type: ignore [attr-defined]
+                tmp = self._flatten_records(response["credits"].pop(c), c)  # type: ignore [attr-defined]
             elif c == "collection":
                 collect = response.pop("belongs_to_collection")
                 if collect is not None:
-                    tmp = pd.json_normalize(collect).add_prefix(f"{c}.")
+                    tmp = self._flatten_records([collect], c)  # type: ignore [list-item]
             elif c == "details":
                 tmp = pd.json_normalize(response)
             else:
-                tmp = pd.json_normalize(response.pop(c)).add_prefix(f"{c}.")
+                tmp = self._flatten_records(response.pop(c), c)  # type: ignore [arg-type]
 
             tmp["tmdb_id"] = tmdb_id
 
@@ -355,111 +603,108 @@ class Movieparse:
                 first_column = tmp.pop("tmdb_id")
                 tmp.insert(0, "tmdb_id", first_column)
 
-                df = pd.concat([df, tmp], axis=0, ignore_index=True)
-            results.append(df)
-        (
-            self.cast,
-            self.collect,
-            self.crew,
-            self.genres,
-            self.prod_comp,
-            self.prod_count,
-            self.spoken_langs,
-            self.details,
-        ) = results
+                dfs.append(tmp)
+
+    @staticmethod
+    def _flatten_records(records: List[Dict[str, Any]], prefix: str) -> pd.DataFrame:
+        """Builds a dataframe from a list of flat records in a single pass.
+
+        Faster than pd.json_normalize for the small, non-nested record lists of a metadata response.
+
+        Args:
+          records: list of dictionaries, missing keys are filled with None.
+          prefix: prefix for column names, separated by a dot.
+        Returns:
+          dataframe with one row per record.
+        """
+        keys = dict.fromkeys(k for r in records for k in r)
+        return pd.DataFrame(
+            {f"{prefix}.{k}": [r.get(k) for r in records] for k in keys},
+            index=range(len(records)),
+        )
 
     def write(self) -> None:
-        """Writes all non-empty metadata dataframes as CSV files to output_dir."""
+        """Writes all non-empty metadata dataframes as _OUTPUT_FORMAT files to output_dir."""
         for fname, df in self._metadata().items():
-            tmp_path = self._OUTPUT_DIR / f"{fname}.csv"
             if df.empty is False:
-                df.to_csv(
-                    tmp_path, date_format="%Y-%m-%d", index=False, float_format="%.3f"
-                )
+                self._write_file(df, fname, date_format="%Y-%m-%d", float_format="%.3f")
+
+    def _write_file(self, df: pd.DataFrame, fname: str, **csv_options: str) -> None:
+        """Writes df as _OUTPUT_FORMAT file to output_dir.
+
+        Parquet and feather files are written with casted types, CSV files through a large write buffer.
+
+        Args:
+          df: dataframe to write.
+          fname: filename without suffix.
+          csv_options: keyword arguments passed to DataFrame.to_csv, ignored for other formats.
+        """
+        tmp_path = self._OUTPUT_DIR / f"{fname}.{self._OUTPUT_FORMAT}"
+        if self._OUTPUT_FORMAT == "parquet":
+            self._to_arrow_compatible(df).to_parquet(
+                tmp_path, compression="snappy", index=False
+            )
+        elif self._OUTPUT_FORMAT == "feather":
+            self._to_arrow_compatible(df).to_feather(tmp_path)
+        else:
+            with open(
+                tmp_path,
+                "w",
+                buffering=self._WRITE_BUFFER_SIZE,
+                encoding="utf-8",
+                newline="",
+            ) as f:
+                df.to_csv(f, index=False, **csv_options)
+
+    def _to_arrow_compatible(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Prepares df for writing parquet and feather files.
+
+        Columns are casted via _assign_types. Non-scalar values like lists are stored as their string representation,
+        just like in CSV files, so that metadata read from a CSV fallback can be mixed with fresh responses.
+
+        Args:
+          df: dataframe to be written.
+        Returns:
+          df with casted columns and serialized non-scalar values.
+        """
+        df = self._assign_types(df)
+        nested = {}
+        for c in df.columns[df.dtypes == object]:
+            is_nested = df[c].map(lambda x: isinstance(x, (list, dict)))
+            if is_nested.any():
+                nested[c] = df[c].mask(is_nested, df[c].astype(str))
+        return df.assign(**nested) if nested else df
 
     def _assign_types(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Casts df columns to specified types.
+        """Casts df columns to the types specified in _TYPES.
 
-        tmdb_id is shared among all metadata files but only listed for mapping.csv.
+        Missing values stay missing: string columns are left as they are and integer or boolean columns containing
+        missing values are casted to their nullable counterpart.
 
         Args:
           df: dataframe to be casted
         Returns:
           df with casted columns.
         """
-        types = {
-            # mapping.csv
-            "tmdb_id": "int32",
-            "tmdb_id_man": "int32",
-            "input": object,  # can be both a string and a path!
-            "canonical_input": str,
-            # cast.csv
-            "cast.adult": bool,
-            "cast.gender": "int8",
-            "cast.id": int,
-            "cast.known_for_department": "category",
-            "cast.name": str,
-            "cast.original_name": str,
-            "cast.popularity": float,
-            "cast.profile_path": str,
-            "cast.cast_id": "int8",
-            "cast.character": str,
-            "cast.credit_id": str,
-            "cast.order": "int8",
-            # collections.csv
-            "collection.id": int,
-            "collection.name": str,
-            "collection.poster_path": str,
-            "collection.backdrop_path": str,
-            # crew.csv
-            "crew.adult": bool,
-            "crew.gender": "int8",
-            "crew.id": int,
-            "crew.known_for_department": "category",
-            "crew.name": str,
-            "crew.original_name": str,
-            "crew.popularity": float,
-            "crew.profile_path": str,
-            "crew.credit_id": str,
-            "crew.department": "category",
-            "crew.job": str,
-            # genres.csv
-            "genres.id": "int8",
-            "genres.name": str,
-            # production_companies.csv
-            "production_companies.id": "int32",
-            "production_companies.logo_path": str,
-            "production_companies.name": "category",
-            "production_companies.origin_country": "category",
-            "production_countries.iso_3166_1": "category",
-            "production_countries.name": str,
-            # spoken_languages.csv
-            "spoken_languages.english_name": "category",
-            "spoken_languages.iso_3166_1": "category",
-            "spoken_languages.name": str,
-            # details.csv
-            "adult": bool,
-            "backdrop_path": str,
-            "budget": int,
-            "homepage": str,
-            "imdb_id": str,
-            "original_language": "category",
-            "original_title": str,
-            "overview": str,
-            "popularity": float,
-            "poster_path": str,
-            "release_date": "datetime64[ns]",
-            "revenue": int,
-            "runtime": "int16",
-            "status": "category",
-            "tagline": str,
-            "title": str,
-            "video": bool,
-            "vote_average": float,
-            "vote_count": "int16",
-        }
+        types = {}
+        for k, v in self._TYPES.items():
+            if k not in df.columns or v is str:
+                continue
+            types[k] = self._nullable_type(v) if df[k].isna().any() else v
+        return df.astype(types, copy=False)
 
-        for k, v in types.items():
-            if k in df.columns:
-                df[k] = df[k].astype(v)
-        return df
+    @staticmethod
+    def _nullable_type(v: Any) -> Any:
+        """Maps integer and boolean types to their nullable counterpart.
+
+        Args:
+          v: type as specified in _TYPES.
+        Returns:
+          nullable type, other types are returned unchanged.
+        """
+        dtype = pd.api.types.pandas_dtype(v)
+        if dtype.kind == "b":
+            return "boolean"
+        if dtype.kind == "i":
+            return dtype.name.capitalize()
+        return v
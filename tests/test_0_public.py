@@ -216,6 +216,11 @@ def test_movieparse_public_interface() -> None:
         "spoken_langs",
     ]
 
-    assert {"mapping", "cached_mapping", "default_codes", *methods, *metadata} == {
-        x for x in dir(m) if not x.startswith("_")
-    }
+    assert {
+        "mapping",
+        "cached_mapping",
+        "default_codes",
+        "output_formats",
+        *methods,
+        *metadata,
+    } == {x for x in dir(m) if not x.startswith("_")}
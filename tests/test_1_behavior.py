@@ -11,9 +11,16 @@ foo = ClassFoo()
 bar = foo.FunctionBar()
 """
 
+import asyncio
+import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
+from types import SimpleNamespace
+from typing import AsyncIterator
+from typing import Dict
 from typing import List
 
+import aiohttp
 import pandas as pd
 import pytest
 
@@ -106,6 +113,7 @@ def test_initialization(output_dir: Path, monkeypatch: pytest.MonkeyPatch) -> No
     * caches should be created
     * metadata in output_dir should be read correctly
     * an API key has to be supplied either by env var or manually
+    * binary output formats require pyarrow
     Args:
       output_dir: output_dir fixture
       monkeypatch: monkeypatch fixture
@@ -148,6 +156,21 @@ def test_initialization(output_dir: Path, monkeypatch: pytest.MonkeyPatch) -> No
         Movieparse()
     assert str(exc_info.value) == "please supply a TMDB_API_KEY!"
 
+    # output_format has to be supported
+    with pytest.raises(Exception) as exc_info:
+        Movieparse(output_format="xlsx")
+    assert str(exc_info.value) == "please supply a valid OUTPUT_FORMAT!"
+
+    # binary output formats need pyarrow
+    with monkeypatch.context() as mp:
+        mp.setitem(sys.modules, "pyarrow", None)
+        with pytest.raises(Exception) as exc_info:
+            Movieparse(tmdb_api_key="example-key", output_format="parquet")
+    assert (
+        str(exc_info.value)
+        == "please install movieparse[parquet] to use the OUTPUT_FORMAT parquet!"
+    )
+
     # supply api key
     m = Movieparse(tmdb_api_key="example-key")
     assert m._TMDB_API_KEY == "example-key"
@@ -214,3 +237,156 @@ def test_badcustomids(output_dir: Path, root_movie_dir: Path) -> None:
     m = Movieparse(output_dir=output_dir, parsing_style=0)
     m.parse_root_movie_dir(root_movie_dir)
     assert set(m.mapping["tmdb_id"]) == {603}
+
+
+class StubSession:
+    """Stands in for a client session, answering requests with the given status codes or errors."""
+
+    def __init__(self, statuses: List[int | Exception]) -> None:
+        """Initializes the stub session.
+
+        Args:
+          statuses: status codes or errors to raise for consecutive requests.
+        """
+        self.statuses = statuses
+        self.attempts = 0
+
+    @asynccontextmanager
+    async def get(
+        self, url: str, params: Dict[str, str]
+    ) -> AsyncIterator[SimpleNamespace]:
+        """Answers a request with the next status code.
+
+        Args:
+          url: requested url.
+          params: query parameters.
+        Yields:
+          response with status and read coroutine.
+        Raises:
+          Exception: if the next status is an error.
+        """
+        status = self.statuses[self.attempts]
+        self.attempts += 1
+        if isinstance(status, Exception):
+            raise status
+
+        async def read() -> bytes:
+            return b'{"id": 550}'
+
+        yield SimpleNamespace(status=status, read=read)
+
+
+def test_fetch_json(output_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Rate limited requests and connection errors are retried, other failed requests are given up.
+
+    Args:
+      output_dir: output_dir fixture
+      monkeypatch: monkeypatch fixture
+    """
+
+    async def no_sleep(delay: float) -> None:
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    m = Movieparse(output_dir=output_dir, tmdb_api_key="example-key")
+
+    session = StubSession([429, 200])
+    result = asyncio.run(m._fetch_json(session, asyncio.Semaphore(1), "url", {}))  # type: ignore [arg-type]
+    assert result == {"id": 550}
+    assert session.attempts == 2
+
+    session = StubSession([404])
+    result = asyncio.run(m._fetch_json(session, asyncio.Semaphore(1), "url", {}))  # type: ignore [arg-type]
+    assert result is None
+    assert session.attempts == 1
+
+    session = StubSession(
+        [aiohttp.ClientConnectionError(), asyncio.TimeoutError(), 200]
+    )
+    result = asyncio.run(m._fetch_json(session, asyncio.Semaphore(1), "url", {}))  # type: ignore [arg-type]
+    assert result == {"id": 550}
+    assert session.attempts == 3
+
+    # persistent errors are given up after _MAX_RETRIES retries
+    session = StubSession([aiohttp.ClientConnectionError()] * (m._MAX_RETRIES + 1))
+    result = asyncio.run(m._fetch_json(session, asyncio.Semaphore(1), "url", {}))  # type: ignore [arg-type]
+    assert result is None
+    assert session.attempts == m._MAX_RETRIES + 1
+
+
+def test_id_cache(output_dir: Path) -> None:
+    """Inputs sharing title and year after normalization are only looked up once."""
+    m = Movieparse(output_dir=output_dir, parsing_style=0)
+    m.parse_movielist(["1999 Fight Club", "1999 fight club "])
+
+    assert list(m.mapping["tmdb_id"]) == [550, 550]
+    assert len(m._id_cache) == 1
+
+
+@pytest.mark.parametrize("output_format", ["parquet", "feather"])
+def test_output_format(output_dir: Path, output_format: str) -> None:
+    """Metadata gets written in output_format and is read back with its types."""
+    m = Movieparse(output_dir=output_dir, parsing_style=0, output_format=output_format)
+    m.parse_movielist(["1999 Fight Club"])
+
+    # missing values must survive casting, just like NaN in CSV files
+    null_record = pd.DataFrame({"tmdb_id": [1], "tagline": [None], "runtime": [None]})
+    m.details = pd.concat([m.details, null_record], ignore_index=True)
+    m.write()
+
+    assert (output_dir / f"details.{output_format}").exists()
+    assert (output_dir / f"mapping.{output_format}").exists()
+    assert (output_dir / "details.csv").exists() is False
+
+    m = Movieparse(output_dir=output_dir, output_format=output_format)
+    assert m.cached_mapping["tmdb_id"].dtype == "int32"
+    assert m.details.empty is False
+    assert m.details["release_date"].dtype == "datetime64[ns]"
+    null_details = m.details[m.details["tmdb_id"] == 1]
+    assert null_details["tagline"].isna().all()
+    assert null_details["runtime"].isna().all()
+
+
+@pytest.mark.parametrize("output_format", ["parquet", "feather"])
+def test_output_format_csv_fallback(output_dir: Path, output_format: str) -> None:
+    """Metadata read from existing CSV files can be written in output_format along with fresh responses."""
+    m = Movieparse(output_dir=output_dir, parsing_style=0)
+    m.parse_movielist(["1999 Fight Club"])
+    m.write()
+
+    m = Movieparse(output_dir=output_dir, parsing_style=0, output_format=output_format)
+    assert m.details.empty is False
+    m.parse_movielist(["1999 The Matrix"])
+    m.write()
+
+    for fname in m._METADATA_ATTRS:
+        if (output_dir / f"{fname}.csv").exists():
+            assert (output_dir / f"{fname}.{output_format}").exists()
+
+    m = Movieparse(output_dir=output_dir, output_format=output_format)
+    assert {550, 603} <= set(m.details["tmdb_id"])
+
+
+@pytest.mark.parametrize("output_format", ["csv", "parquet", "feather"])
+def test_missing_values(output_dir: Path, output_format: str) -> None:
+    """Missing values survive a round trip in every output_format."""
+    m = Movieparse(
+        output_dir=output_dir, tmdb_api_key="example-key", output_format=output_format
+    )
+    m.details = pd.DataFrame(
+        {
+            "tmdb_id": [550, 1],
+            "tagline": ["Mischief. Mayhem. Soap.", None],
+            "runtime": [139, None],
+            "release_date": ["1999-10-15", None],
+        }
+    )
+    m.write()
+
+    m = Movieparse(
+        output_dir=output_dir, tmdb_api_key="example-key", output_format=output_format
+    )
+    assert m.details["tmdb_id"].dtype == "int32"
+    assert m.details["runtime"].dtype == "Int16"
+    assert m.details["release_date"].dtype == "datetime64[ns]"
+    assert m.details.iloc[1].isna().sum() == 3